@@ -7,6 +7,9 @@ import requests
 import random
 import re
 import unicodedata
+import hashlib
+from datetime import datetime, timezone
+from typing import NamedTuple
 from discord.ext import commands
 from bs4 import BeautifulSoup
 from bs4 import NavigableString
@@ -44,6 +47,22 @@ USER_AGENTS = [
 ]
 
 
+class Announcement(NamedTuple):
+    """A single parsed announcement from the notice board."""
+    title: str
+    link: str
+    summary: str
+    modal_id: str
+    source: str
+    fetched_at: datetime
+    content_hash: str
+
+
+def hash_content(title, summary):
+    """Return a stable hash of an announcement's title and summary."""
+    return hashlib.sha256(f"{title}\n{summary}".encode('utf-8')).hexdigest()
+
+
 def create_embed(title, url=None):
     """Create a Discord embed for an announcement."""
     embed = discord.Embed(
@@ -226,8 +245,13 @@ def format_table(table_elem):
     return '```\n' + '\n'.join(formatted_rows) + '\n```'
 
 
-async def fetch_announcements(base_url, add_to_seen=True, limit_newest=False):
-    """Fetch announcements using requests."""
+async def iter_announcements(base_url, add_to_seen=True, limit_newest=False, stats=None):
+    """Yield new announcements page by page, as soon as each page is parsed.
+
+    Each yielded item is a list of Announcement records in page order (newest first).
+    Pages without new announcements are not yielded. If a stats dict is passed, it is
+    updated with 'total_rows' and 'pages' as the crawl progresses.
+    """
     headers = {
         'User-Agent': random.choice(USER_AGENTS),
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -236,7 +260,10 @@ async def fetch_announcements(base_url, add_to_seen=True, limit_newest=False):
         'Pragma': 'no-cache',
         'If-Modified-Since': '0'
     }
-    announcements = []
+    if stats is None:
+        stats = {}
+    stats['total_rows'] = 0
+    stats['pages'] = 0
     total_rows = 0
     page_count = 0
     current_url = base_url
@@ -254,6 +281,9 @@ async def fetch_announcements(base_url, add_to_seen=True, limit_newest=False):
             rows = soup.select('#oglasna_tabla_id tbody tr, table tbody tr, .oglasna-tabla tbody tr')
             logger.info(f"Found {len(rows)} rows on page {page_count}")
             total_rows += len(rows)
+            stats['total_rows'] = total_rows
+            stats['pages'] = page_count
+            page_announcements = []
 
             if not rows:
                 logger.warning(f"No rows found on page {page_count}")
@@ -503,18 +533,40 @@ async def fetch_announcements(base_url, add_to_seen=True, limit_newest=False):
                     seen_announcements.add(unique_id)
                     logger.info(f"Added to seen: {post_title} (modal_id: {unique_id})")
                 elif unique_id not in seen_announcements:
-                    announcements.append((post_title, post_link, summary_text, unique_id))
+                    page_announcements.append(Announcement(
+                        title=post_title,
+                        link=post_link,
+                        summary=summary_text,
+                        modal_id=unique_id,
+                        source=base_url,
+                        fetched_at=datetime.now(timezone.utc),
+                        content_hash=hash_content(post_title, summary_text),
+                    ))
                     logger.info(f"Added to new announcements: {post_title} (modal_id: {unique_id})")
 
             next_link = soup.select_one('a.next, a[rel="next"], a.page-link, a[href*="page="], a[href*="/page/"]')
             current_url = urljoin(base_url, next_link['href']) if next_link and next_link.get('href') else None
+            # Free the parsed tree before handing the page off to the caller
+            soup.decompose()
 
         except requests.RequestException as e:
             logger.error(f"Error fetching page {current_url}: {e}")
             break
 
+        if page_announcements:
+            yield page_announcements
+
     logger.info(f"Processed {total_rows} announcements across {page_count} pages")
-    return announcements, total_rows
+
+
+async def fetch_announcements(base_url, add_to_seen=True, limit_newest=False):
+    """Fetch announcements from all pages and return them as a single list."""
+    announcements = []
+    stats = {}
+    async for page in iter_announcements(base_url, add_to_seen=add_to_seen, limit_newest=limit_newest,
+                                         stats=stats):
+        announcements.extend(page)
+    return announcements, stats['total_rows']
 
 
 async def scan_initial_announcements():
@@ -552,30 +604,32 @@ async def check_announcements():
     while not bot.is_closed():
         try:
             logger.info(f"Before check: seen_announcements size = {len(seen_announcements)}")
-            new_announcements, total_rows = await fetch_announcements(
-                'https://imi.pmf.kg.ac.rs/oglasna-tabla', add_to_seen=False
-            )
-            logger.info(f"Found {len(new_announcements)} new announcements")
-
-            for title, link, summary, modal_id in reversed(new_announcements):
-                seen_announcements.add(modal_id)
-                logger.info(f"New announcement: {title} (modal_id: {modal_id})")
-                try:
-                    # Create embed with the properly fixed link
-                    embed = create_embed(title, link)
-
-                    # Send message with role mention, title, and summary in content only
-                    message_content = f"<@&{ROLE_ID}> **{title}**"
-                    if summary and summary.strip() and summary != "No summary available.":
-                        message_content += f"\n\n{summary}"
-
-                    await channel.send(content=message_content, embed=embed)
-                    logger.info(f"Sent notification for: {title} (modal_id: {modal_id})")
-                    await asyncio.sleep(1)
-                except discord.errors.Forbidden:
-                    logger.error(f"Bot lacks permissions to send messages in channel {CHANNEL_ID}")
-                except discord.errors.HTTPException as e:
-                    logger.error(f"Failed to send notification for {title}: {e}")
+            new_count = 0
+            async for page in iter_announcements('https://imi.pmf.kg.ac.rs/oglasna-tabla', add_to_seen=False):
+                # Send each page oldest first, as soon as it has been parsed
+                for announcement in reversed(page):
+                    new_count += 1
+                    seen_announcements.add(announcement.modal_id)
+                    logger.info(f"New announcement: {announcement.title} (modal_id: {announcement.modal_id})")
+                    try:
+                        # Create embed with the properly fixed link
+                        embed = create_embed(announcement.title, announcement.link)
+
+                        # Send message with role mention, title, and summary in content only
+                        message_content = f"<@&{ROLE_ID}> **{announcement.title}**"
+                        summary = announcement.summary
+                        if summary and summary.strip() and summary != "No summary available.":
+                            message_content += f"\n\n{summary}"
+
+                        await channel.send(content=message_content, embed=embed)
+                        logger.info(f"Sent notification for: {announcement.title} "
+                                    f"(modal_id: {announcement.modal_id})")
+                        await asyncio.sleep(1)
+                    except discord.errors.Forbidden:
+                        logger.error(f"Bot lacks permissions to send messages in channel {CHANNEL_ID}")
+                    except discord.errors.HTTPException as e:
+                        logger.error(f"Failed to send notification for {announcement.title}: {e}")
+            logger.info(f"Found {new_count} new announcements")
 
             if len(seen_announcements) > 50:
                 seen_announcements.clear()